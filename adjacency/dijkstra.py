@@ -1,5 +1,6 @@
 import dataclasses
-from typing import Callable, Dict, List, Protocol, Self, Set, Tuple
+import heapq
+from typing import Callable, Dict, List, Optional, Protocol, Self, Set, Tuple
 
 from .board_layout import Land
 
@@ -37,35 +38,49 @@ def distances_from(
         ],
         Comparable,
     ] = _default_tiebreaker,
+    max_dist: Optional[int] = None,
 ) -> Tuple[Dict[str, int], Dict[str, str]]:
     visited: Set[str] = set()
-    queue: Dict[str, Land] = {}
+    # (distance, discovery order, land); the discovery order breaks distance ties
+    # in favour of the land seen first, so popping never compares lands. A land
+    # is only pushed when its distance drops, so entries further than the
+    # known distance are stale and get skipped.
+    queue: List[Tuple[int, int, Land]] = []
+    discovered: Dict[str, int] = {}
     dist: Dict[str, int] = {}
     prev: Dict[str, str] = {}
     priority: Dict[str, Comparable] = {}
     dist[land.key] = 0
-    queue[land.key] = land
+    discovered[land.key] = 0
+    heapq.heappush(queue, (0, 0, land))
     priority[land.key] = tiebreaker(land, dist, prev)
     while queue:
-        vertex = min(queue.values(), key=lambda v: dist[v.key])
-        del queue[vertex.key]
+        base, _, vertex = heapq.heappop(queue)
+        if base > dist[vertex.key]:
+            continue
+        if max_dist is not None and base > max_dist:
+            break
         if vertex.key not in priority:
             priority[vertex.key] = tiebreaker(vertex, dist, prev)
+        vertex_priority = priority[vertex.key]
         visited.add(vertex.key)
-        base = dist[vertex.key]
         for key, link in vertex.links.items():
             if key in visited:
                 continue
-            queue[key] = link.land
+            if key not in discovered:
+                discovered[key] = len(discovered)
             alt = base + link.distance
-            if key in dist and alt > dist[key]:
-                continue
-            if (
-                key in dist
-                and alt == dist[key]
-                and priority[vertex.key] > priority[prev[key]]
-            ):
+            if max_dist is not None and alt > max_dist:
+                # never reported, so never worth queueing
                 continue
+            known = dist.get(key)
+            if known is not None:
+                if alt > known:
+                    continue
+                if alt == known and vertex_priority > priority[prev[key]]:
+                    continue
+            if known is None or alt < known:
+                heapq.heappush(queue, (alt, discovered[key], link.land))
             dist[key] = alt
             prev[key] = vertex.key
     return dist, prev
@@ -1,6 +1,5 @@
 import collections
-import itertools
-from typing import Any, Callable, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import json5
 
@@ -14,43 +13,53 @@ Generates the adjacency list of the map. Uses board_layout.py
 """
 
 
-def link_hub(p: Board, q: Board, r: Board, s: Board, t: Board, u: Board) -> None:
+# (board, edge, other board, other edge) to link within a single islet
+IsletLinks = Tuple[Tuple[str, Edge, str, Edge], ...]
+
+HUB_LINKS: IsletLinks = (
     # the left standard-3
-    p.edges[Edge.CLOCK6].link(q.edges[Edge.CLOCK9])
-    q.edges[Edge.CLOCK6].link(r.edges[Edge.CLOCK9])
-    r.edges[Edge.CLOCK6].link(p.edges[Edge.CLOCK9])
+    ("P", Edge.CLOCK6, "Q", Edge.CLOCK9),
+    ("Q", Edge.CLOCK6, "R", Edge.CLOCK9),
+    ("R", Edge.CLOCK6, "P", Edge.CLOCK9),
     # the right standard-3
-    s.edges[Edge.CLOCK6].link(t.edges[Edge.CLOCK9])
-    t.edges[Edge.CLOCK6].link(u.edges[Edge.CLOCK9])
-    u.edges[Edge.CLOCK6].link(s.edges[Edge.CLOCK9])
+    ("S", Edge.CLOCK6, "T", Edge.CLOCK9),
+    ("T", Edge.CLOCK6, "U", Edge.CLOCK9),
+    ("U", Edge.CLOCK6, "S", Edge.CLOCK9),
     # and link them
-    q.edges[Edge.CLOCK3].link(s.edges[Edge.CLOCK3])
-
+    ("Q", Edge.CLOCK3, "S", Edge.CLOCK3),
+)
 
-def link_spoke(p: Board, q: Board, r: Board, s: Board, t: Board, u: Board) -> None:
+SPOKE_LINKS: IsletLinks = (
     # the left coastline
-    p.edges[Edge.CLOCK9].link(q.edges[Edge.CLOCK3])
-    q.edges[Edge.CLOCK9].link(r.edges[Edge.CLOCK3])
+    ("P", Edge.CLOCK9, "Q", Edge.CLOCK3),
+    ("Q", Edge.CLOCK9, "R", Edge.CLOCK3),
     # the right coastline
-    s.edges[Edge.CLOCK9].link(t.edges[Edge.CLOCK3])
-    t.edges[Edge.CLOCK9].link(u.edges[Edge.CLOCK3])
+    ("S", Edge.CLOCK9, "T", Edge.CLOCK3),
+    ("T", Edge.CLOCK9, "U", Edge.CLOCK3),
     # and link them
-    r.edges[Edge.CLOCK9].link(s.edges[Edge.CLOCK6])
+    ("R", Edge.CLOCK9, "S", Edge.CLOCK6),
+)
 
+RIM_LINKS: IsletLinks = (
+    ("P", Edge.CLOCK9, "Q", Edge.CLOCK9),
+    ("Q", Edge.CLOCK6, "R", Edge.CLOCK6),
+    ("R", Edge.CLOCK9, "S", Edge.CLOCK3),
+    ("S", Edge.CLOCK9, "T", Edge.CLOCK3),
+    ("T", Edge.CLOCK9, "U", Edge.CLOCK3),
+)
 
-def link_rim(p: Board, q: Board, r: Board, s: Board, t: Board, u: Board) -> None:
-    p.edges[Edge.CLOCK9].link(q.edges[Edge.CLOCK9])
-    q.edges[Edge.CLOCK6].link(r.edges[Edge.CLOCK6])
-    r.edges[Edge.CLOCK9].link(s.edges[Edge.CLOCK3])
-    s.edges[Edge.CLOCK9].link(t.edges[Edge.CLOCK3])
-    t.edges[Edge.CLOCK9].link(u.edges[Edge.CLOCK3])
+# boards of a single islet, by letter
+Islet = Dict[str, Board]
+
+# parsed once, every map only reads from it
+with open("config/144p_board_layout.json5", encoding="utf-8") as f:
+    _layout_data = json5.load(f)
 
 
 class Map144P:
     def __init__(self, with_archipelago: bool = True) -> None:
         self._with_archipelago = with_archipelago
-        with open("config/144p_board_layout.json5", encoding="utf-8") as f:
-            self.data = json5.load(f)
+        self.data = _layout_data
         self.boards: Dict[str, Board] = {}
         self._load_continent("blue")
         self._load_continent("orange")
@@ -60,90 +69,54 @@ class Map144P:
     def _load_continent(self, name: str) -> None:
         data = self.data[name]
 
-        for islet in data["rim"]:
-            self._load_islet(islet, link_rim)
-        for islet in data["spokes"]:
-            self._load_islet(islet, link_spoke)
-        for islet in data["hub"]:
-            self._load_islet(islet, link_hub)
+        rim = [self._load_islet(islet, RIM_LINKS) for islet in data["rim"]]
+        spokes = [self._load_islet(islet, SPOKE_LINKS) for islet in data["spokes"]]
+        hub = [self._load_islet(islet, HUB_LINKS) for islet in data["hub"]]
 
-        rim_ahead = iter(itertools.cycle(data["rim"]))
-        next(rim_ahead)
         for rim1, rim2, spoke in zip(
-            data["rim"],  # 🧀
-            rim_ahead,  # 🌙
-            data["spokes"],  # 🐍
+            rim,  # 🧀
+            rim[1:] + rim[:1],  # 🌙
+            spokes,  # 🐍
         ):
-            rim1p = self.boards[f"{rim1}P"]
-            spokep = self.boards[f"{spoke}P"]
-            rim2u = self.boards[f"{rim2}U"]
-            rim1p.edges[Edge.CLOCK6].link(spokep.edges[Edge.CLOCK3])
-            spokep.edges[Edge.CLOCK6].link(rim2u.edges[Edge.CLOCK9])
-
-            rim2s = self.boards[f"{rim2}S"]
-            spokeu = self.boards[f"{spoke}U"]
-            spokeu.edges[Edge.CLOCK9].link(rim2s.edges[Edge.CLOCK6])
-
-        for spoke1, spoke2, hub in zip(
-            data["spokes"][0::2],  # 🐍
-            data["spokes"][1::2],  # ♾️
-            data["hub"],  # 🏝️
+            rim1["P"].edges[Edge.CLOCK6].link(spoke["P"].edges[Edge.CLOCK3])
+            spoke["P"].edges[Edge.CLOCK6].link(rim2["U"].edges[Edge.CLOCK9])
+            spoke["U"].edges[Edge.CLOCK9].link(rim2["S"].edges[Edge.CLOCK6])
+
+        for spoke1, spoke2, hub1 in zip(
+            spokes[0::2],  # 🐍
+            spokes[1::2],  # ♾️
+            hub,  # 🏝️
         ):
-            spoke1s = self.boards[f"{spoke1}S"]
-            hubp = self.boards[f"{hub}P"]
-            spoke1s.edges[Edge.CLOCK3].link(hubp.edges[Edge.CLOCK3])
-
-            spoke2s = self.boards[f"{spoke2}S"]
-            hubt = self.boards[f"{hub}T"]
-            spoke2s.edges[Edge.CLOCK3].link(hubt.edges[Edge.CLOCK3])
+            spoke1["S"].edges[Edge.CLOCK3].link(hub1["P"].edges[Edge.CLOCK3])
+            spoke2["S"].edges[Edge.CLOCK3].link(hub1["T"].edges[Edge.CLOCK3])
 
         for i in range(3):
-            hub1 = data["hub"][(i + 0) % 3]  # 🏝️
-            hub2 = data["hub"][(i + 1) % 3]  # 💖
-            hub1u = self.boards[f"{hub1}U"]
-            hub2r = self.boards[f"{hub2}R"]
-            hub1u.edges[Edge.CLOCK3].link(hub2r.edges[Edge.CLOCK3])
+            hub1 = hub[(i + 0) % 3]  # 🏝️
+            hub2 = hub[(i + 1) % 3]  # 💖
+            hub1["U"].edges[Edge.CLOCK3].link(hub2["R"].edges[Edge.CLOCK3])
+
+        if not self._with_archipelago:
+            return
 
         for i in range(6):
-            spoke = data["spokes"][i]  # 🐍
-            hub1 = data["hub"][((i + 5) // 2) % 3]  # 😎
-            hub2 = data["hub"][((i + 1) // 2) % 3]  # 🏝️
-            rim = data["rim"][i]  # 🧀
-
-            hub1_letter = "U" if (i % 2 == 0) else "Q"
-            hub1_board = self.boards[f"{hub1}{hub1_letter}"]
-            if self._with_archipelago:
-                for spoke_letter in "PQR":
-                    self.boards[f"{spoke}{spoke_letter}"].link_archipelago(hub1_board)
-                self.boards[f"{rim}Q"].link_archipelago(hub1_board)
-
-                hub2_letter = "T" if (i % 2 == 0) else "P"
-                hub2_board = self.boards[f"{hub2}{hub2_letter}"]
-                for spoke_letter in "STU":
-                    self.boards[f"{spoke}{spoke_letter}"].link_archipelago(hub2_board)
-
-    def _load_islet(
-        self,
-        name: str,
-        link: Callable[
-            [
-                Board,
-                Board,
-                Board,
-                Board,
-                Board,
-                Board,
-            ],
-            None,
-        ],
-    ) -> None:
-        p = self._load_board(name, "P")
-        q = self._load_board(name, "Q")
-        r = self._load_board(name, "R")
-        s = self._load_board(name, "S")
-        t = self._load_board(name, "T")
-        u = self._load_board(name, "U")
-        link(p, q, r, s, t, u)
+            spoke = spokes[i]  # 🐍
+            hub1 = hub[((i + 5) // 2) % 3]  # 😎
+            hub2 = hub[((i + 1) // 2) % 3]  # 🏝️
+
+            hub1_board = hub1["U" if (i % 2 == 0) else "Q"]
+            for spoke_letter in "PQR":
+                spoke[spoke_letter].link_archipelago(hub1_board)
+            rim[i]["Q"].link_archipelago(hub1_board)  # 🧀
+
+            hub2_board = hub2["T" if (i % 2 == 0) else "P"]
+            for spoke_letter in "STU":
+                spoke[spoke_letter].link_archipelago(hub2_board)
+
+    def _load_islet(self, name: str, links: IsletLinks) -> Islet:
+        islet = {letter: self._load_board(name, letter) for letter in "PQRSTU"}
+        for board, edge, other_board, other_edge in links:
+            islet[board].edges[edge].link(islet[other_board].edges[other_edge])
+        return islet
 
     def _load_board(self, islet: str, letter: str) -> Board:
         name = f"{islet}{letter}"
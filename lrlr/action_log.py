@@ -124,11 +124,15 @@ class Actionlog:
         else:
             self.entries.append((self._nest, entry))
 
+    def child(self) -> Self:
+        cls = type(self)
+        child = cls()
+        child._nest = self._nest + 1
+        return child
+
     @contextlib.contextmanager
     def fork(self) -> Iterator[Self]:
-        cls = type(self)
-        fork = cls()
-        fork._nest = self._nest + 1
+        fork = self.child()
         try:
             yield fork
         finally:
@@ -1,23 +1,34 @@
 from __future__ import annotations
 
-import abc
-import contextlib
 import dataclasses
+import functools
 import itertools
-from typing import Callable, Dict, Iterator, List, Optional, Tuple, Type
+import operator
+import weakref
+from types import TracebackType
+from typing import Callable, Dict, Hashable, List, Optional, Tuple, Type
 
 from adjacency import board_layout, dijkstra, gen_144p
 
 from .action_log import Action, Actionlog, LogEntry
 
+PieceType = int
 
-@dataclasses.dataclass
-class Pieces:
-    cnt: int
-    tipe: PieceType
+EXPLORER: PieceType = 0
+TOWN: PieceType = 1
+CITY: PieceType = 2
+DAHAN: PieceType = 3
 
-    def __str__(self) -> str:
-        return str(self.cnt)
+INVADERS = (EXPLORER, TOWN, CITY)
+PIECE_TYPES = INVADERS + (DAHAN,)
+
+# per-piece-type stats, indexed by PieceType
+HEALTH = (1, 2, 3, 2)
+FEAR = (0, 1, 2, 0)
+RESPONSE: Tuple[Optional[PieceType], ...] = (None, EXPLORER, TOWN, None)
+
+# the only piece types that military response ever adds
+MR_TYPES = tuple(tipe for tipe in PIECE_TYPES if tipe in RESPONSE)
 
 
 LAIR_KEY = "LAIR"
@@ -38,36 +49,54 @@ class Land:
         self.key = key
         self.display_name = display_name
         self.land_type = land_type
-        self.explorers = Explorer.new(explorers)
-        self.towns = Town.new(towns)
-        self.cities = City.new(cities)
-        self.dahan = Dahan.new(dahan)
-        self.mr_explorers = Explorer.new()
-        self.mr_towns = Town.new()
+        # piece counts, both indexed by PieceType
+        self.pieces = [explorers, towns, cities, dahan]
+        self.mr_pieces = [0] * len(PIECE_TYPES)
         self.conf = conf
 
+    @property
+    def explorers(self) -> int:
+        return self.pieces[EXPLORER]
+
+    @explorers.setter
+    def explorers(self, cnt: int) -> None:
+        self.pieces[EXPLORER] = cnt
+
+    @property
+    def towns(self) -> int:
+        return self.pieces[TOWN]
+
+    @towns.setter
+    def towns(self, cnt: int) -> None:
+        self.pieces[TOWN] = cnt
+
+    @property
+    def cities(self) -> int:
+        return self.pieces[CITY]
+
+    @cities.setter
+    def cities(self, cnt: int) -> None:
+        self.pieces[CITY] = cnt
+
+    @property
+    def dahan(self) -> int:
+        return self.pieces[DAHAN]
+
+    @dahan.setter
+    def dahan(self, cnt: int) -> None:
+        self.pieces[DAHAN] = cnt
+
     def mr(self) -> None:
-        for tipe in (Explorer, Town, City):
-            mr = tipe.select_mr(self)
-            tipe.select(self).cnt += mr.cnt
-            mr.cnt = 0
+        for tipe in MR_TYPES:
+            if self.mr_pieces[tipe]:
+                self.pieces[tipe] += self.mr_pieces[tipe]
+                self.mr_pieces[tipe] = 0
 
     def total_invaders(self) -> int:
-        return self.explorers.cnt + self.towns.cnt + self.cities.cnt
+        return self.explorers + self.towns + self.cities
 
     def __str__(self) -> str:
-        pieces = ", ".join(
-            [
-                f"{tipe.name(self.conf.piece_names)}={tipe.select(self).cnt}"
-                for tipe in (
-                    Explorer,
-                    Town,
-                    City,
-                    Dahan,
-                )
-            ]
-        )
-        return f"({pieces})"
+        return self.conf.piece_names.land_format.format(*self.pieces)
 
 
 @dataclasses.dataclass
@@ -77,6 +106,20 @@ class PieceNames:
     city: str
     dahan: str
 
+    def name(self, tipe: PieceType) -> str:
+        return (self.explorer, self.town, self.city, self.dahan)[tipe]
+
+    @functools.cached_property
+    def land_format(self) -> str:
+        "str.format() template for Land.__str__, one field per PieceType"
+        pieces = ", ".join(
+            [
+                self.name(tipe).replace("{", "{{").replace("}", "}}") + "={}"
+                for tipe in PIECE_TYPES
+            ]
+        )
+        return f"({pieces})"
+
 
 piece_names_text = PieceNames(
     explorer="explorer",
@@ -93,124 +136,6 @@ piece_names_emoji = PieceNames(
 )
 
 
-class _PieceType(abc.ABC):
-    @classmethod
-    def new(cls, cnt: int = 0) -> Pieces:
-        return Pieces(cnt=cnt, tipe=cls)
-
-    health: int
-    fear: int
-    response: Optional[PieceType]
-
-    @classmethod
-    @abc.abstractmethod
-    def select(cls, land: Land) -> Pieces:
-        pass
-
-    @classmethod
-    @abc.abstractmethod
-    def select_mr(cls, land: Land) -> Pieces:
-        pass
-
-    @classmethod
-    @abc.abstractmethod
-    def name(cls, pn: PieceNames) -> str:
-        pass
-
-
-PieceType = Type[_PieceType]
-
-
-class Void(_PieceType):
-    health = 0
-    fear = 0
-    response = None
-
-    @classmethod
-    def select(cls, land: Land) -> Pieces:
-        return cls.new()
-
-    @classmethod
-    def select_mr(cls, land: Land) -> Pieces:
-        return cls.new()
-
-    @classmethod
-    def name(cls, pn: PieceNames) -> str:
-        return "void"
-
-
-class Explorer(_PieceType):
-    health = 1
-    fear = 0
-    response = None
-
-    @classmethod
-    def select(cls, land: Land) -> Pieces:
-        return land.explorers
-
-    @classmethod
-    def select_mr(cls, land: Land) -> Pieces:
-        return land.mr_explorers
-
-    @classmethod
-    def name(cls, pn: PieceNames) -> str:
-        return pn.explorer
-
-
-class Town(_PieceType):
-    health = 2
-    fear = 1
-    response = Explorer
-
-    @classmethod
-    def select(cls, land: Land) -> Pieces:
-        return land.towns
-
-    @classmethod
-    def select_mr(cls, land: Land) -> Pieces:
-        return land.mr_towns
-
-    @classmethod
-    def name(cls, pn: PieceNames) -> str:
-        return pn.town
-
-
-class City(_PieceType):
-    health = 3
-    fear = 2
-    response = Town
-
-    @classmethod
-    def select(cls, land: Land) -> Pieces:
-        return land.cities
-
-    @classmethod
-    def select_mr(cls, land: Land) -> Pieces:
-        return Void.new()
-
-    @classmethod
-    def name(cls, pn: PieceNames) -> str:
-        return pn.city
-
-
-class Dahan(_PieceType):
-    health = 2
-    fear = 0
-    response = None
-
-    @classmethod
-    def select(cls, land: Land) -> Pieces:
-        return land.dahan
-
-    @classmethod
-    def select_mr(cls, land: Land) -> Pieces:
-        return Void.new()
-
-    @classmethod
-    def name(cls, pn: PieceNames) -> str:
-        return pn.dahan
-
-
 @dataclasses.dataclass
 class LairInnateConf:
     reserve_gathers: int = 0
@@ -231,6 +156,8 @@ class LairConf:
     slurp_to_lair: bool = False
     display_name_range: bool = False
     allow_missing_r1: bool = False
+    # lands further away than this are left out of the distance map entirely
+    max_dist: Optional[int] = None
 
     def _terrain_priority(self, land_type: str) -> int:
         try:
@@ -250,6 +177,12 @@ class LairConf:
 
 ConvertLand = Callable[[Land], Land]
 
+# src_land, action, src_piece, intermediate_lands, tgt_land, tgt_piece, count, mult
+PendingEntry = Tuple[str, Action, str, Optional[List[str]], str, str, int, int]
+
+# static sort key (ignored, dist, land_priority), r1 root's pieces, land
+PriorityEntry = Tuple[Tuple[bool, int, int], List[int], Land]
+
 
 @dataclasses.dataclass
 class LairState:
@@ -267,12 +200,43 @@ class LairState:
     fear: int = 0
 
 
+DistanceMap = Tuple[Dict[str, int], Dict[str, str]]
+
+# maps are never modified once a Lair is built on them, so results stay valid for
+# as long as the map itself is alive.
+_distance_map_cache: weakref.WeakKeyDictionary[
+    gen_144p.Map144P,
+    Dict[Hashable, DistanceMap],
+] = weakref.WeakKeyDictionary()
+
+
 def construct_distance_map(
     conf: LairConf,
     lands: Dict[str, Land],
     map: gen_144p.Map144P,
     src: str,
-) -> Tuple[Dict[str, int], Dict[str, str]]:
+) -> DistanceMap:
+    # everything the tiebreaker looks at
+    cache_key = (
+        src,
+        conf.terrain_priority,
+        tuple(conf.ignore_lands),
+        tuple((key, land.dahan) for key, land in lands.items()),
+        conf.max_dist,
+    )
+    cache = _distance_map_cache.setdefault(map, {})
+    if cache_key not in cache:
+        cache[cache_key] = _construct_distance_map(conf, lands, map, src)
+    dist, prev = cache[cache_key]
+    return dict(dist), dict(prev)
+
+
+def _construct_distance_map(
+    conf: LairConf,
+    lands: Dict[str, Land],
+    map: gen_144p.Map144P,
+    src: str,
+) -> DistanceMap:
     def tiebreaker(
         land: board_layout.Land,
         dist: Dict[str, int],
@@ -287,7 +251,7 @@ def construct_distance_map(
                 assert conf.allow_missing_r1
                 r1_dahan = 0
             else:
-                r1_dahan = lands[key].dahan.cnt
+                r1_dahan = lands[key].dahan
         else:
             r1_dahan = 0  # it's the lair..
 
@@ -301,7 +265,40 @@ def construct_distance_map(
 
         return (ignored, -priority, r1_dahan)
 
-    return dijkstra.distances_from(map.land(src), tiebreaker)
+    return dijkstra.distances_from(map.land(src), tiebreaker, conf.max_dist)
+
+
+# fork()s the lair log and adds a summary line for r0. a plain class instead of
+# contextlib since it wraps every top level action.
+class _TopLog:
+    def __init__(self, lair: Lair, what: str):
+        self.lair = lair
+        self.what = what
+
+    def __enter__(self) -> None:
+        state = self.lair.state
+        self.oldlog = state.log
+        self.newlog = state.log = self.oldlog.child()
+        self.before = str(state.r0)
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        state = self.lair.state
+        try:
+            if exc_type is None:
+                self.lair._commit_log()
+                self.oldlog.entry(
+                    LogEntry(
+                        text=f"{self.what} in {state.r0.key}: {self.before} => {state.r0}"
+                    )
+                )
+        finally:
+            self.oldlog.entries.extend(self.newlog.entries)
+            state.log = self.oldlog
 
 
 class Lair:
@@ -315,8 +312,17 @@ class Lair:
     ):
         self.map = map
         self.conf = conf
-        self.uncommitted: List[LogEntry] = []
+        self.uncommitted: List[PendingEntry] = []
         self.expected_ravages_left = 0
+        self.piece_name: Dict[PieceType, str] = {
+            tipe: conf.piece_names.name(tipe) for tipe in PIECE_TYPES
+        }
+        self.leave_behind: Dict[Tuple[str, PieceType], int] = {
+            (key, tipe): cnt
+            for key, pieces in conf.leave_behind.items()
+            for tipe in PIECE_TYPES
+            if (cnt := pieces.get(piece_names_text.name(tipe), 0))
+        }
 
         dist, prev = construct_distance_map(conf, lands, map, src)
         self.gathers_to = {
@@ -324,6 +330,9 @@ class Lair:
             for key in lands.keys()
             if key in prev and dist[key] != 0
         }
+        self.r1_root: Dict[str, Optional[Land]] = {}
+        for key in self.gathers_to.keys():
+            self.r1_root[key] = self._calc_r1_root(lands[key], dist)
         r0 = lands[LAIR_KEY]
         r1 = []
         r2 = []
@@ -336,7 +345,7 @@ class Lair:
             if dist[key] == 1:
                 self.gathers_to[key] = r0
                 r1.append(land)
-            elif self._r1_gathers_to(land, dist) is not None:
+            elif self._r1_gathers_to(land) is not None:
                 r2.append(land)
             else:
                 unpathable.append(land)
@@ -349,9 +358,21 @@ class Lair:
             log=log,
             dist=dist,
         )
+        self.land_priority = {
+            key: conf.land_priority(land, land.land_type, self._coastal(land))
+            for key, land in lands.items()
+        }
         self.gather_cost = {
             key: self._calc_gather_cost(lands[key]) for key in self.gathers_to.keys()
         }
+        self.r1_by_priority = [self._priority_entry(land) for land in r1]
+        self.r2_by_priority = [self._priority_entry(land) for land in r2]
+
+    def _coastal(self, land: Land) -> bool:
+        try:
+            return self.map.land(land.key).coastal
+        except KeyError:
+            return False
 
     def set_expected_ravages(self, ravages: int) -> None:
         self.expected_ravages_left = ravages
@@ -371,52 +392,84 @@ class Lair:
             land = prev
             if prev.key in self.conf.ignore_lands:
                 continue
-            coastal = self.map.land(land.key).coastal
-            if self.conf.land_priority(prev, prev.land_type, coastal) < len(
-                self.conf.terrain_priority
-            ):
+            if self.land_priority[prev.key] < len(self.conf.terrain_priority):
                 continue
             return cost
 
-    def _r1_gathers_to(
+    def _calc_r1_root(
         self,
         land: Land,
         dist: Dict[str, int],
     ) -> Optional[Land]:
-        while dist[land.key] > 1:
-            prev_land = self.gathers_to[land.key]
-            if prev_land is None:
-                return None
-            land = prev_land
-        return land
+        path = []
+        root: Optional[Land] = land
+        while root is not None and dist[root.key] > 1:
+            if root.key in self.r1_root:
+                root = self.r1_root[root.key]
+                break
+            path.append(root.key)
+            root = self.gathers_to[root.key]
+        # every land on the way shares the same root
+        for key in path:
+            self.r1_root[key] = root
+        return root
+
+    def _r1_gathers_to(self, land: Land) -> Optional[Land]:
+        return self.r1_root[land.key]
 
     def _commit_log(self) -> None:
-        self.uncommitted.sort(key=lambda entry: entry.src_land or "")
-        for entry in self.uncommitted:
-            self.state.log.entry(entry)
+        self.uncommitted.sort(key=operator.itemgetter(0))
+        for (
+            src_land,
+            action,
+            src_piece,
+            intermediate_lands,
+            tgt_land,
+            tgt_piece,
+            count,
+            mult,
+        ) in self.uncommitted:
+            self.state.log.entry(
+                LogEntry(
+                    action=action,
+                    src_land=src_land,
+                    src_piece=src_piece,
+                    intermediate_lands=intermediate_lands,
+                    tgt_land=tgt_land,
+                    tgt_piece=tgt_piece,
+                    count=count,
+                    mult=mult,
+                )
+            )
         self.uncommitted = []
 
-    def _noncommit_entry(self, entry: LogEntry) -> None:
+    def _noncommit_entry(self, entry: PendingEntry) -> None:
+        # the LogEntry itself is only built on commit
         self.uncommitted.append(entry)
 
     def _xchg(
         self,
         src_land: Land,
         src_tipe: PieceType,
-        tgt: Pieces,
+        tgt: Optional[List[int]],  # None for pieces that are simply destroyed
+        tgt_tipe: PieceType,
         cnt: int,
     ) -> int:
-        leave = self.conf.leave_behind.get(src_land.key, {}).get(
-            src_tipe.name(piece_names_text), 0
-        )
-        src = src_tipe.select(src_land)
-        actual = min(max(src.cnt - leave, 0), cnt)
-        src.cnt -= actual
-        tgt.cnt += actual
+        leave = self.leave_behind.get((src_land.key, src_tipe), 0)
+        src = src_land.pieces
+        # same as min(max(src[src_tipe] - leave, 0), cnt), without the builtin calls
+        actual = src[src_tipe] - leave
+        if actual < 0:
+            actual = 0
+        if actual > cnt:
+            actual = cnt
+        src[src_tipe] -= actual
+        if tgt is not None:
+            tgt[tgt_tipe] += actual
         return actual
 
     def _gather(self, tipe: PieceType, land: Land, cnt: int) -> int:
-        if land.key in self.conf.ignore_lands:
+        if cnt <= 0 or land.key in self.conf.ignore_lands:
             return 0
         cost = self.gather_cost[land.key]
         intermediate_lands: List[str] = []
@@ -432,72 +485,83 @@ class Lair:
 
         if (
             self.state.dist.get(gathers_to.key) == 1
-            and gathers_to.dahan.cnt > 0
-            and tipe.health > self.expected_ravages_left
+            and gathers_to.pieces[DAHAN] > 0
+            and HEALTH[tipe] > self.expected_ravages_left
         ):
             intermediate_lands.append(gathers_to.display_name)
             cost += 1
             gathers_to = self.gathers_to[gathers_to.key]
             assert gathers_to
 
-        actual = self._xchg(land, tipe, tipe.select(gathers_to), cnt // cost)
+        actual = self._xchg(land, tipe, gathers_to.pieces, tipe, cnt // cost)
         self.state.total_gathers += actual
         if actual:
-            piece_name = tipe.name(self.conf.piece_names)
+            piece_name = self.piece_name[tipe]
             self._noncommit_entry(
-                LogEntry(
-                    action=Action.GATHER,
-                    src_land=land.display_name,
-                    src_piece=piece_name,
-                    intermediate_lands=intermediate_lands,
-                    tgt_land=gathers_to.display_name,
-                    tgt_piece=piece_name,
-                    count=actual,
-                    mult=cost,
+                (
+                    land.display_name,
+                    Action.GATHER,
+                    piece_name,
+                    intermediate_lands,
+                    gathers_to.display_name,
+                    piece_name,
+                    actual,
+                    cost,
                 )
             )
         return actual
 
     def _downgrade(self, tipe: PieceType, land: Land, cnt: int) -> int:
-        assert tipe.response
-        actual = self._xchg(land, tipe, tipe.response.select(land), cnt)
+        response = RESPONSE[tipe]
+        assert response is not None
+        actual = self._xchg(land, tipe, land.pieces, response, cnt)
         if actual:
             self._noncommit_entry(
-                LogEntry(
-                    action=Action.DOWNGRADE,
-                    src_land=land.display_name,
-                    src_piece=tipe.name(self.conf.piece_names),
-                    tgt_land=land.display_name,
-                    tgt_piece=tipe.response.name(self.conf.piece_names),
-                    count=actual,
+                (
+                    land.display_name,
+                    Action.DOWNGRADE,
+                    self.piece_name[tipe],
+                    None,
+                    land.display_name,
+                    self.piece_name[response],
+                    actual,
+                    1,
                 )
             )
         return actual
 
     def _lair1(self) -> None:
         r0 = self.state.r0
-        downgrades = (r0.explorers.cnt + r0.dahan.cnt) // 3
+        downgrades = (r0.explorers + r0.dahan) // 3
         self.state.log.entry(LogEntry(text=f"available downgrades: {downgrades}"))
-        downgrades -= self._downgrade(Town, r0, downgrades)
-        downgrades -= self._downgrade(City, r0, downgrades)
+        downgrades -= self._downgrade(TOWN, r0, downgrades)
+        downgrades -= self._downgrade(CITY, r0, downgrades)
         self.state.wasted_downgrades += downgrades
 
     def _r1_least_dahan(self) -> List[Land]:
-        return sorted(self.state.r1, key=lambda land: land.dahan.cnt)
+        return sorted(self.state.r1, key=lambda land: land.pieces[DAHAN])
 
     def _r1_most_dahan(self) -> List[Land]:
-        return sorted(self.state.r1, key=lambda land: -land.dahan.cnt)
+        return sorted(self.state.r1, key=lambda land: -land.pieces[DAHAN])
 
     def _lair2(self) -> None:
+        # range-1 gathers go straight to the lair, so dahan counts in range 1
+        # only change once we gather the dahan themselves
+        r1_most_dahan = self._r1_most_dahan()
+
         gathers = 1
-        for tipe in (Explorer, Town):
-            for land in self._r1_most_dahan():
+        for tipe in (EXPLORER, TOWN):
+            for land in r1_most_dahan:
+                if gathers <= 0:
+                    break
                 gathers -= self._gather(tipe, land, gathers)
         self.state.wasted_invader_gathers += gathers
 
         gathers = 1
-        for land in self._r1_most_dahan():
-            gathers -= self._gather(Dahan, land, gathers)
+        for land in r1_most_dahan:
+            if gathers <= 0:
+                break
+            gathers -= self._gather(DAHAN, land, gathers)
         self.state.wasted_dahan_gathers += gathers
 
     def _reserve(self, reserve: int, what: str, cnt: int) -> int:
@@ -507,53 +571,65 @@ class Lair:
             return to_reserve
         return 0
 
-    def _least_r1_dahan_land_priority_key(
-        self,
-        land: Land,
-    ) -> Tuple[int, int, int, int]:
-        try:
-            coastal = self.map.land(land.key).coastal
-        except KeyError:
-            coastal = False
-        land_priority = self.conf.land_priority(land, land.land_type, coastal)
+    def _priority_entry(self, land: Land) -> PriorityEntry:
+        land_priority = self.land_priority[land.key]
 
         dist = self.state.dist[land.key]
-        r1_land = self._r1_gathers_to(land, self.state.dist)
+        r1_land = self._r1_gathers_to(land)
         assert r1_land
 
         ignored = land.key in self.conf.ignore_lands
 
         return (
-            ignored,
-            # swap `dist` and `land_priority` order to change sorting.
-            # REVISIT make this a toggle?
-            dist,
-            land_priority,
-            r1_land.dahan.cnt,
+            (
+                ignored,
+                # swap `dist` and `land_priority` order to change sorting.
+                # REVISIT make this a toggle?
+                dist,
+                land_priority,
+            ),
+            r1_land.pieces,
+            land,
         )
 
+    def _least_r1_dahan_land_priority(
+        self,
+        entries: List[PriorityEntry],
+    ) -> List[Land]:
+        # only the r1 root's dahan changes between sorts; the index keeps the
+        # sort stable and stops ties from comparing lands
+        decorated = [
+            (prio, r1_pieces[DAHAN], i, land)
+            for i, (prio, r1_pieces, land) in enumerate(entries)
+        ]
+        decorated.sort()
+        return [land for _, _, _, land in decorated]
+
     def _lair3(self, conf: LairInnateConf) -> None:
         r0 = self.state.r0
-        gathers = (r0.explorers.cnt + r0.dahan.cnt) // 6
+        gathers = (r0.explorers + r0.dahan) // 6
         self.state.log.entry(LogEntry(text=f"available gathers: {gathers}"))
         with self.state.log.indent():
             gathers -= self._reserve(conf.reserve_gathers, "gathers", gathers)
 
-        for land in sorted(
-            self.state.r2,
-            key=self._least_r1_dahan_land_priority_key,
-        ):
+        for land in self._least_r1_dahan_land_priority(self.r2_by_priority):
+            if gathers <= 0:
+                break
             if self.state.dist[land.key] > conf.max_range:
                 continue
-            gathers -= self._gather(City, land, gathers)
-            gathers -= self._gather(Town, land, gathers)
-            gathers -= self._gather(Explorer, land, gathers)
+            gathers -= self._gather(CITY, land, gathers)
+            gathers -= self._gather(TOWN, land, gathers)
+            gathers -= self._gather(EXPLORER, land, gathers)
 
         # TODO: loop again if we have gathers left and didn't clear r2,
         #       but need to ensure resulting log doesn't break causality.
 
-        for tipe in (Explorer, Town, City):
+        for tipe in INVADERS:
+            if gathers <= 0:
+                break
             for land in self._r1_most_dahan():
+                if gathers <= 0:
+                    break
                 gathers -= self._gather(tipe, land, gathers)
 
         self._commit_log()
@@ -562,20 +638,8 @@ class Lair:
         )
         self.state.wasted_invader_gathers += gathers
 
-    @contextlib.contextmanager
-    def _top_log(self, what: str) -> Iterator[None]:
-        oldlog = self.state.log
-        with self.state.log.fork() as newlog:
-            self.state.log = newlog
-            before = str(self.state.r0)
-            yield
-            self._commit_log()
-            oldlog.entry(
-                LogEntry(
-                    text=f"{what} in {self.state.r0.key}: {before} => {self.state.r0}"
-                )
-            )
-        self.state.log = oldlog
+    def _top_log(self, what: str) -> _TopLog:
+        return _TopLog(self, what)
 
     def _lair_all(self, colour: str, conf: LairInnateConf) -> None:
         with self._top_log(f"lair-{colour}-thresh1"):
@@ -593,74 +657,82 @@ class Lair:
 
     def _call_one(
         self,
-        it: Callable[[], List[Land]],
+        lands: List[Land],
         tipe: PieceType,
         gathers: int,
     ) -> int:
-        for land in it():
+        for land in lands:
+            if gathers <= 0:
+                break
             gathers -= self._gather(tipe, land, gathers)
         return gathers
 
     def call(self) -> None:
         with self._top_log("call"):
+            # see _lair2, invader gathers leave range-1 dahan counts alone
+            r1_most_dahan = self._r1_most_dahan()
+            self.state.wasted_invader_gathers += self._call_one(r1_most_dahan, TOWN, 5)
             self.state.wasted_invader_gathers += self._call_one(
-                self._r1_most_dahan, Town, 5
-            )
-            self.state.wasted_invader_gathers += self._call_one(
-                self._r1_most_dahan, Explorer, 15
+                r1_most_dahan, EXPLORER, 15
             )
             self.state.wasted_dahan_gathers += self._call_one(
-                self._r1_least_dahan, Dahan, 5
+                self._r1_least_dahan(), DAHAN, 5
             )
 
     def _damage(self, land: Land, tipe: PieceType, dmg: int) -> int:
         assert land.key in self.gathers_to
 
         respond_to: Optional[Land] = None
-        if tipe.response:
-            if land.dahan.cnt:
+        response: Optional[List[int]] = None
+        response_tipe = RESPONSE[tipe]
+        if response_tipe is not None:
+            if land.pieces[DAHAN]:
                 respond_to = land
             else:
                 respond_to = self.gathers_to[land.key]
             assert respond_to
-            response = tipe.response.select_mr(respond_to)
-        else:
-            response = Void.new()
-
-        kill = self._xchg(land, tipe, response, dmg // tipe.health)
+            response = respond_to.mr_pieces
+
+        health = HEALTH[tipe]
+        kill = self._xchg(
+            land,
+            tipe,
+            response,
+            tipe if response_tipe is None else response_tipe,
+            dmg // health,
+        )
         if kill:
             self._noncommit_entry(
-                LogEntry(
-                    action=Action.DESTROY,
-                    src_land=land.display_name,
-                    src_piece=tipe.name(self.conf.piece_names),
-                    tgt_land=respond_to.display_name if respond_to else "",
-                    tgt_piece=(
-                        tipe.response.name(self.conf.piece_names)
-                        if tipe.response
-                        else ""
-                    ),
-                    count=kill,
+                (
+                    land.display_name,
+                    Action.DESTROY,
+                    self.piece_name[tipe],
+                    None,
+                    respond_to.display_name if respond_to else "",
+                    self.piece_name[response_tipe] if response_tipe is not None else "",
+                    kill,
+                    1,
                 )
             )
-        self.state.fear += kill * tipe.fear
-        return kill * tipe.health
+        self.state.fear += kill * FEAR[tipe]
+        return kill * health
 
     def _ravage(self) -> None:
         self.expected_ravages_left -= 1
 
         r0 = self.state.r0
-        dmg = max(0, r0.explorers.cnt - 6) + r0.towns.cnt * 2 + r0.cities.cnt * 3
+        dmg = max(0, r0.explorers - 6) + r0.towns * 2 + r0.cities * 3
 
-        lands = sorted(
-            self.state.r1,
-            key=self._least_r1_dahan_land_priority_key,
-        )
+        lands = self._least_r1_dahan_land_priority(self.r1_by_priority)
         for land in lands:
-            dmg -= self._damage(land, Town, dmg)
-            dmg -= self._damage(land, City, dmg)
+            if dmg <= 0:
+                break
+            dmg -= self._damage(land, TOWN, dmg)
+            dmg -= self._damage(land, CITY, dmg)
         for land in lands:
-            dmg -= self._damage(land, Explorer, dmg)
+            if dmg <= 0:
+                break
+            dmg -= self._damage(land, EXPLORER, dmg)
 
         self._commit_log()
         self.state.log.entry(
@@ -676,31 +748,31 @@ class Lair:
             self._ravage()
 
     def _add(self, land: Land, tipe: PieceType, cnt: int) -> None:
-        tipe.select(land).cnt += cnt
+        land.pieces[tipe] += cnt
         self.state.log.entry(
             LogEntry(
                 action=Action.ADD,
                 tgt_land=land.display_name,
-                tgt_piece=tipe.name(self.conf.piece_names),
+                tgt_piece=self.piece_name[tipe],
                 count=cnt,
             )
         )
 
     def _build(self, land: Land) -> None:
-        if all(tipe.select(land).cnt == 0 for tipe in (Explorer, Town, City)):
+        if all(land.pieces[tipe] == 0 for tipe in INVADERS):
             return
 
         tipe: PieceType
-        if land.towns.cnt > land.cities.cnt:
-            tipe = City
+        if land.towns > land.cities:
+            tipe = CITY
         else:
-            tipe = Town
+            tipe = TOWN
         self._add(land, tipe, 1)
 
     def blur(self) -> None:
         with self._top_log("blur"):
-            if self.state.r0.dahan.cnt > 0:
-                self._add(self.state.r0, Dahan, 1)
+            if self.state.r0.dahan > 0:
+                self._add(self.state.r0, DAHAN, 1)
             self._build(self.state.r0)
             self._ravage()
 
@@ -40,21 +40,10 @@ def landdiff(
     allow_clear: bool = True,
 ) -> str:
     assert a.key == b.key
-    if (
-        a.explorers.cnt == b.explorers.cnt
-        and a.towns.cnt == b.towns.cnt
-        and a.cities.cnt == b.cities.cnt
-        and a.dahan.cnt == b.dahan.cnt
-    ):
+    if a.pieces == b.pieces:
         return ""
     bstr = str(b)
-    if (
-        allow_clear
-        and b.cities.cnt == 0
-        and b.towns.cnt == 0
-        and b.explorers.cnt == 0
-        and b.dahan.cnt == 0
-    ):
+    if allow_clear and not any(b.pieces):
         bstr = "CLEAR"
     return f"{a.display_name}: {a} => {bstr}"
 
@@ -313,14 +302,14 @@ def cat_cafe(finallair: lair.LairState, parser: parse.Parser) -> None:
     r0 = parser.parse_initial_lair()
     w.writerow(
         CatCafeRow(
-            explorers_diff=r0.explorers.cnt,
-            towns_diff=r0.towns.cnt,
-            cities_diff=r0.cities.cnt,
-            dahan_diff=r0.dahan.cnt,
-            explorers_total=r0.explorers.cnt,
-            towns_total=r0.towns.cnt,
-            cities_total=r0.cities.cnt,
-            dahan_total=r0.dahan.cnt,
+            explorers_diff=r0.explorers,
+            towns_diff=r0.towns,
+            cities_diff=r0.cities,
+            dahan_diff=r0.dahan,
+            explorers_total=r0.explorers,
+            towns_total=r0.towns,
+            cities_total=r0.cities,
+            dahan_total=r0.dahan,
             source="LAIR",
             action="From last phase",
         ).to_csv()
@@ -378,25 +367,25 @@ def cat_cafe(finallair: lair.LairState, parser: parse.Parser) -> None:
             return 0
 
         for src, tgt, cnt in entry.pieces():
-            row.explorers_diff -= piece_diff(lair.Explorer, src, cnt) * src_mult
-            row.towns_diff -= piece_diff(lair.Town, src, cnt) * src_mult
-            row.cities_diff -= piece_diff(lair.City, src, cnt) * src_mult
-            row.dahan_diff -= piece_diff(lair.Dahan, src, cnt) * src_mult
-
-            row.explorers_diff += piece_diff(lair.Explorer, tgt, cnt) * tgt_mult
-            row.towns_diff += piece_diff(lair.Town, tgt, cnt) * tgt_mult
-            row.cities_diff += piece_diff(lair.City, tgt, cnt) * tgt_mult
-            row.dahan_diff += piece_diff(lair.Dahan, tgt, cnt) * tgt_mult
-
-        r0.explorers.cnt += row.explorers_diff
-        r0.towns.cnt += row.towns_diff
-        r0.cities.cnt += row.cities_diff
-        r0.dahan.cnt += row.dahan_diff
-
-        row.explorers_total = r0.explorers.cnt
-        row.towns_total = r0.towns.cnt
-        row.cities_total = r0.cities.cnt
-        row.dahan_total = r0.dahan.cnt
+            row.explorers_diff -= piece_diff(lair.EXPLORER, src, cnt) * src_mult
+            row.towns_diff -= piece_diff(lair.TOWN, src, cnt) * src_mult
+            row.cities_diff -= piece_diff(lair.CITY, src, cnt) * src_mult
+            row.dahan_diff -= piece_diff(lair.DAHAN, src, cnt) * src_mult
+
+            row.explorers_diff += piece_diff(lair.EXPLORER, tgt, cnt) * tgt_mult
+            row.towns_diff += piece_diff(lair.TOWN, tgt, cnt) * tgt_mult
+            row.cities_diff += piece_diff(lair.CITY, tgt, cnt) * tgt_mult
+            row.dahan_diff += piece_diff(lair.DAHAN, tgt, cnt) * tgt_mult
+
+        r0.explorers += row.explorers_diff
+        r0.towns += row.towns_diff
+        r0.cities += row.cities_diff
+        r0.dahan += row.dahan_diff
+
+        row.explorers_total = r0.explorers
+        row.towns_total = r0.towns
+        row.cities_total = r0.cities
+        row.dahan_total = r0.dahan
 
         w.writerow(row.to_csv())
 
@@ -22,6 +22,7 @@ def main() -> None:
     args = parse_args()
     lair_conf = lair.LairConf(
         allow_missing_r1=True,
+        max_dist=args.range,
     )
     parse_conf = parse.ParseConf(
         directory=f"config/turn{args.turn}",
@@ -19,6 +19,17 @@ def to_int(s: str) -> int:
     return int(s)
 
 
+_map_cache: Dict[str, Map144P] = {}
+
+
+def load_map(weaves: str) -> Map144P:
+    if weaves not in _map_cache:
+        map = Map144P(with_archipelago=False)
+        map.weave_from_file(weaves)
+        _map_cache[weaves] = map
+    return _map_cache[weaves]
+
+
 @dataclasses.dataclass
 class ParseConf:
     directory: str
@@ -83,19 +94,19 @@ class CsvAction:
                         conf=lands.lair_conf,
                     )
                     lands.distant[key] = land
-            for piece, added in zip(
-                (land.explorers, land.towns, land.cities, land.dahan),
+            for tipe, added in zip(
+                lair.PIECE_TYPES,
                 (self.explorers, self.towns, self.cities, self.dahan),
             ):
                 delta = mult * to_int(added)
-                piece.cnt += delta
-                if not allow_negative and piece.cnt < 0:
-                    piece_name = piece.tipe.name(lair.piece_names_text)
-                    orig = piece.cnt - delta
+                land.pieces[tipe] += delta
+                if not allow_negative and land.pieces[tipe] < 0:
+                    piece_name = lair.piece_names_text.name(tipe)
+                    orig = land.pieces[tipe] - delta
                     raise ValueError(
                         f"action {self.action_id} ({self.action_name}) is trying to substract {added} {piece_name} from {land.key}, but there are only {orig}"
                     )
-                assert allow_negative or piece.cnt >= 0, f"land {land.key}"
+                assert allow_negative or land.pieces[tipe] >= 0, f"land {land.key}"
 
     def csv_data(self) -> Tuple[str, ...]:
         return dataclasses.astuple(self)
@@ -202,7 +213,7 @@ class Parser:
         return open(self._path(basename), encoding="utf-8")
 
     def match_piece(self, piece: lair.PieceType, name: str) -> bool:
-        return piece.name(self.lair_conf.piece_names) == name
+        return self.lair_conf.piece_names.name(piece) == name
 
     def _parse_initial_lair(self) -> Tuple[lair.Land, str]:
         with self._open(self.INITIAL_LAIR) as f:
@@ -243,8 +254,7 @@ class Parser:
 
         lands[lair.LAIR_KEY], src = self._parse_initial_lair()
 
-        map = Map144P(with_archipelago=False)
-        map.weave_from_file(self._path(self.WEAVES))
+        map = load_map(self._path(self.WEAVES))
 
         with self._open(self.START) as f:
             it = iter(csv.reader(f))